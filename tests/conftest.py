@@ -1,4 +1,5 @@
 import asyncio
+from functools import lru_cache
 from inspect import isfunction
 import operator
 from unittest.mock import MagicMock, Mock, NonCallableMagicMock
@@ -16,6 +17,9 @@ from uzi.graph.core import Graph, DepKey, DepSrc
 from uzi.scopes import Scope
 
 
+_notset = object()
+
+
 @pytest.fixture
 def new_args():
     return ()
@@ -36,13 +40,18 @@ def new(cls, new_args, new_kwargs):
 #     return ()
 
 
-@pytest.fixture
-def immutable_attrs(cls):
-    return [
+@lru_cache(maxsize=None)
+def _immutable_attrs(cls):
+    return tuple(
         a
         for a in dir(cls)
         if not (a[:2] == "__" == a[-2:] or isfunction(getattr(cls, a)))
-    ]
+    )
+
+
+@pytest.fixture
+def immutable_attrs(cls):
+    return list(_immutable_attrs(cls))
 
 
 @pytest.fixture
@@ -134,7 +143,7 @@ def MockGroup(MockContainer, request: pytest.FixtureRequest):
 @pytest.fixture
 def MockNode():
     def make(abstract=None, graph=None, **kw):
-        mk = MagicMock(Node)
+        mk = Mock(Node)
 
         if not abstract is None:
             kw["abstract"] = abstract
@@ -162,13 +171,17 @@ def MockInjector(MockGraph):
             if getattr(k, "is_async", False):
                 mk = MagicMock(asyncio.sleep)
             else:
-                mk = MagicMock(t.Callable)
+                mk = Mock(t.Callable)
             return mk
 
         deps = {}
-        mi.__getitem__ = Mock(
-            wraps=lambda k: deps.get(k) or deps.setdefault(k, mock_dep(k))
-        )
+
+        def getitem(k):
+            if (v := deps.get(k, _notset)) is _notset:
+                v = deps[k] = mock_dep(k)
+            return v
+
+        mi.__getitem__ = Mock(wraps=getitem)
         mi.__setitem__ = Mock(wraps=lambda k, v: deps.__setitem__(k, v))
 
         for k, v in kw.items():
@@ -186,9 +199,9 @@ def MockProvider(MockNode):
         deps = {}
 
         def mock_dep(a, s):
-            if not (a, s) in deps:
-                deps[a, s] = MockNode(a, s, provider=mi)
-            return deps[a, s]
+            if (v := deps.get((a, s), _notset)) is _notset:
+                v = deps[a, s] = MockNode(a, s, provider=mi)
+            return v
 
         mi._resolve = MagicMock(wraps=mock_dep)
         mi.container = None
@@ -237,12 +250,13 @@ def MockGraph(MockContainer, MockNode):
         deps = {}
 
         def getitem(k):
-            if k in deps:
-                return deps[k]
+            if not (v := deps.get(k, _notset)) is _notset:
+                return v
             elif not isinstance(k, DepKey):
                 return deps.setdefault(k, getitem(DepKey(k, mi.container)))
 
-            return deps.setdefault(k, MockNode(abstract=k, graph=mi))
+            v = deps[k] = MockNode(abstract=k, graph=mi)
+            return v
 
         if parent:
             kw["parent"] = parent = (
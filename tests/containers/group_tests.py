@@ -67,6 +67,19 @@ class GroupTest(BaseTestCase[_T_Ioc]):
         c1.__contains__.assert_called_with(object)
         c2.__contains__.assert_called_with(object)
 
+    def test_providers(self, new: _T_FnNew):
+        c1, c2 = Container("c1"), Container("c2")
+        sub = new([c1, c2])
+        providers = sub.providers
+        assert not _T in providers
+
+        c2.value(_T, "c2")
+        assert providers is sub.providers
+        assert providers[_T] is c2.providers[_T]
+
+        c1.value(_T, "c1")
+        assert providers[_T] is c1.providers[_T]
+
     def test_create(self, new: _T_FnNew):
         sub = new()
         assert sub != new(sub.bases)
@@ -69,6 +69,26 @@ class InjectorTests(BaseTestCase[Injector]):
     def test_immutable(self, new: _T_FnNew, immutable_attrs):
         self.assert_immutable(new(), immutable_attrs)
 
+    def test_contains_subclass(self, mock_graph):
+        class SubInjector(Injector):
+            __slots__ = ()
+
+        root = SubInjector(mock_graph, _null_injector)
+        sub = SubInjector(mock_graph, Injector(mock_graph, root))
+        node = mock_graph[_T]
+        assert not node in sub
+        root[node]
+        assert node in sub and node in root
+        assert not _T in sub
+
+    def test_falsy_bound_callable(self, new: _T_FnNew, mock_graph):
+        fn = MagicMock(__bool__=lambda s: False)
+        node = MagicMock(Node, graph=mock_graph, bind=MagicMock(return_value=fn))
+        sub = new()
+        assert sub[node] is fn
+        assert node in sub
+        node.bind.assert_called_once_with(sub)
+
     @xfail(raises=(InjectorLookupError, TypeError), strict=True)
     @parametrize(
         "key", [_T_Miss, SimpleNode(_T_Miss, NullGraph(), concrete=MagicMock(_T_Miss))]
@@ -39,11 +39,22 @@ class NullInjectorTests(BaseTestCase[NullInjector]):
     def test_compare(self, new: _T_FnNew):
         sub = new()
         assert sub == new() == copy(sub)
+        assert sub is new()
         assert not sub != new()
         assert not sub == object()
         assert sub != object()
         assert hash(sub) == hash(new())
 
+    def test_subclass_singleton(self, new: _T_FnNew):
+        class Sub(self.type_):
+            __slots__ = ()
+
+        sub = Sub()
+        assert isinstance(sub, Sub)
+        assert sub is Sub()
+        assert new() is not sub
+        assert new().__class__ is self.type_
+
     def test_is_blank(self, new: _T_FnNew):
         sub = new()
         assert len(sub) == 0
@@ -111,6 +111,19 @@ def test_parents(new: _T_FnNew, MockContainer: type[Container]):
     assert tuple(it) == (sub3, sub2, sub1)
 
 
+def test_contains_subclass(MockContainer: type[Container]):
+    class SubGraph(Graph):
+        __slots__ = ()
+
+    root = SubGraph(MockContainer())
+    mid = Graph(MockContainer(), root)
+    sub = SubGraph(MockContainer(), mid)
+
+    assert not _T in sub
+    assert root.container in sub and mid.container in sub
+    assert not sub.container in root
+
+
 @xfail(raises=ProError, strict=True)
 def test_parent_with_same_container(new: _T_FnNew, MockContainer: type[Container]):
     c = MockContainer()
@@ -131,6 +144,24 @@ def test_parent_with_container(new: _T_FnNew, MockContainer: type[Container]):
     new(c2, sub)
 
 
+def test_make_key(new: _T_FnNew):
+    sub = new()
+    key = sub.make_key(_T)
+    assert key.graph is sub
+    assert key is sub.make_key(_T) is sub.make_key(key)
+    assert key is sub.make_key(_T, sub.container)
+    assert not key is new().make_key(_T)
+
+
+def test_make_key_shared_container(new: _T_FnNew, MockContainer: type[Container]):
+    c = MockContainer()
+    sub1, sub2 = new(c, new(MockContainer())), new(c, new(MockContainer()))
+    key1, key2 = sub1.make_key(_T), sub2.make_key(_T)
+    assert key1.graph is sub1 and key2.graph is sub2
+    assert not key1 is key2 and key1 != key2
+    assert key1 is sub1.make_key(_T) and key2 is sub2.make_key(_T)
+
+
 def test_find_provider(
     new: _T_FnNew, MockContainer: type[Container], MockProvider: type[Provider]
 ):
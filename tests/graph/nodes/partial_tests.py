@@ -81,6 +81,10 @@ class PartialDependencyTests(NodeTestCase[Dependency]):
         assert not val is fn(*a, **kw) is self.value
         assert not val is fn(*a, **kw) is self.value
 
+    def test_bind_without_params(self, new: T_NewDep, mock_injector: Injector):
+        subject = new(params=BoundParams.make(()))
+        assert subject.bind(mock_injector) is subject.concrete
+
 
 from uzi.graph.nodes import AsyncPartial as Dependency
 
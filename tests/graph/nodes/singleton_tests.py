@@ -1,5 +1,7 @@
 import asyncio
 from inspect import isawaitable, signature
+from threading import Barrier, Event, Thread
+from time import sleep
 from unittest.mock import MagicMock
 import pytest
 import typing as t
@@ -58,6 +60,37 @@ class SingletonDependencyTests(NodeTestCase[Dependency]):
         assert val is fn() is self.value
         assert val is fn() is self.value
 
+    def test_thread_safe(self, new: _T_NewNode, value_setter, mock_injector: Injector):
+        n, started, release = 8, Event(), Event()
+        barrier = Barrier(n)
+
+        def slow(*a, **kw):
+            started.set()
+            release.wait(5)
+            return value_setter(*a, **kw)
+
+        concrete = MagicMock(slow, wraps=slow)
+        fn = new(concrete=concrete, thread_safe=True).bind(mock_injector)
+        results = []
+
+        def run():
+            barrier.wait(5)
+            results.append(fn())
+
+        threads = [Thread(target=run) for _ in range(n)]
+        for th in threads:
+            th.start()
+
+        assert started.wait(5)
+        sleep(0.05)
+        release.set()
+        for th in threads:
+            th.join(5)
+
+        assert len(results) == n
+        assert concrete.call_count == 1
+        assert all(val is self.value for val in results)
+
 
 from uzi.graph.nodes import AsyncSingleton as Dependency
 
@@ -46,10 +46,23 @@ def test_basic(new: _T_FnNew):
     assert sub != _T
     assert not sub == _T
     hash(sub)
+    assert not hasattr(sub, "__dict__")
     cp = copy(sub)
     assert sub == cp == deepcopy(sub)
 
 
+def test_replace(new: _T_FnNew):
+    sub = new()
+    assert sub.replace() == sub
+    assert sub.replace(abstract=_Tx) == new(_Tx)
+    assert sub.replace(default=None).default is None
+
+
+@xfail(raises=TypeError, strict=True)
+def test_replace_invalid(new: _T_FnNew):
+    new().replace(abstrct=_Tx)
+
+
 # def test_predicate_operations(new: _T_FnNew):
 #     sub, pred = new(), ~ProNoopPredicate()
 #     assert sub
@@ -0,0 +1,21 @@
+import typing as t
+
+from uzi.markers import Dep, DependencyMarker, is_dependency_marker
+
+
+def test_basic():
+    assert is_dependency_marker(Dep(str))
+    assert is_dependency_marker(t.Annotated[str, Dep(str)])
+    assert not is_dependency_marker(str)
+    assert not is_dependency_marker(object())
+
+
+def test_cache_invalidated_on_register():
+    class Foo:
+        __origin__ = None
+
+    foo = Foo()
+    assert not is_dependency_marker(foo)
+    assert not is_dependency_marker(foo)
+    DependencyMarker.register(Foo)
+    assert is_dependency_marker(foo)
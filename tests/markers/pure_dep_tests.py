@@ -45,7 +45,8 @@ def test_basic(new: _T_FnNew):
     assert sub == _T
     assert sub != _Tx
     assert hash(sub) == hash(_T)
-    assert sub.lookup
+    assert not hasattr(sub, "__dict__")
+    assert sub.lookup is sub.lookup
     cp = copy(sub)
     assert sub == cp == deepcopy(sub)
 
@@ -5,6 +5,7 @@ import pytest
 
 
 from collections import abc
+from enum import Enum
 from uzi.markers import (
     ProAndPredicate,
     _PredicateBase,
@@ -87,6 +88,17 @@ def test_immutable(new_predicate: _T_New, immutable_attrs):
     checks.is_immutable(new_predicate, immutable_attrs)
 
 
+def test_slots(new_predicate: _T_New):
+    sub = new_predicate()
+    if isinstance(sub, Enum):
+        # Enum members carry a `__dict__`; check the predicate bases stay slotted.
+        mod = ProPredicate.__module__
+        bases = [b for b in sub.__class__.__mro__[1:] if b.__module__ == mod]
+        assert bases and all("__slots__" in b.__dict__ for b in bases)
+    else:
+        assert not hasattr(sub, "__dict__")
+
+
 def test_simple_and(new_predicate: _T_New):
     sub1, sub2 = new_predicate(), new_predicate()
     assert sub1 == sub2 and sub1 == (sub1 & sub2)
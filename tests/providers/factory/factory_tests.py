@@ -6,6 +6,8 @@ import pytest
 
 import typing as t
 from uzi import Dep
+from uzi.containers import Container
+from uzi.scopes import Scope
 
 
 from uzi.providers import Factory as Provider
@@ -35,3 +37,48 @@ class FactoryProviderTests(ProviderTestCase[Provider]):
         subject.use(partial(subject.concrete))
         sig = subject.get_signature()
         assert isinstance(sig, Signature)
+
+    def test_get_signature_cached(self, new: _T_NewPro):
+        subject = new()
+        subject._freeze()
+        assert subject.get_signature() is subject.get_signature()
+
+    def test_get_signature_forward_ref(self, new: _T_NewPro, monkeypatch):
+        class Later:
+            pass
+
+        def fn(dep: "_LaterDep" = None):
+            return dep
+
+        subject = new(fn)
+        subject._freeze()
+        sig = subject.get_signature()
+        assert isinstance(sig.parameters["dep"].annotation, t.ForwardRef)
+        assert not sig is subject.get_signature()
+
+        monkeypatch.setitem(globals(), "_LaterDep", Later)
+        sig = subject.get_signature()
+        assert sig.parameters["dep"].annotation is Later
+        assert sig is subject.get_signature()
+
+    def test_late_forward_ref_injection(self, monkeypatch):
+        class Svc:
+            pass
+
+        class Later:
+            pass
+
+        def make_svc(dep: "_LaterDep" = None):
+            return dep
+
+        container = Container("late")
+        container.factory(Svc, make_svc)
+
+        inj = Scope(container, Scope(Container("first"))).injector()
+        assert inj.make(Svc) is None
+
+        monkeypatch.setitem(globals(), "_LaterDep", Later)
+        container.value(Later, later := Later())
+
+        inj = Scope(container, Scope(Container("second"))).injector()
+        assert inj.make(Svc) is later
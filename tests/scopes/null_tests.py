@@ -40,9 +40,19 @@ class NullScopeTests(BaseTestCase[NullScope]):
         sub = new()
         assert sub == new()
         assert not sub != new()
-        assert not sub is new()
+        assert sub is new()
         assert hash(sub) == hash(new())
 
+    def test_subclass_singleton(self, new: _T_FnNew):
+        class Sub(self.type_):
+            __slots__ = ()
+
+        sub = Sub()
+        assert isinstance(sub, Sub)
+        assert sub is Sub()
+        assert new() is not sub
+        assert new().__class__ is self.type_
+
     @xfail(raises=TypeError, strict=True)
     def test_fail_invalid_getitem(self, new: _T_FnNew):
         new()[2345.6789]
@@ -11,6 +11,7 @@ from uzi.containers import Container
 from uzi.exceptions import InvalidStateError
 from uzi.graph.core import Graph, _null_graph
 from uzi.injectors import Injector
+from uzi.markers import ONLY_SELF, SKIP_SELF
 from uzi.scopes import Scope
 
 
@@ -212,3 +213,18 @@ def test_as_contextmanager_after_setup(new: _T_FnNew, cls: type[Scope], MockInje
             assert sub.active
             assert io is inj is inj_ is sub.current
         assert not sub.active
+
+
+def test_scope_predicates_across_parents(cls: type[Scope]):
+    class Foo:
+        pass
+
+    a, b, c = Container("a"), Container("b"), Container("c")
+    a.value(Foo, "a"), b.value(Foo, "b"), c.value(Foo, "c")
+
+    graphs = {v: cls(c, cls(p)).graph for p, v in ((a, "a"), (b, "b"))}
+    for val, graph in graphs.items():
+        key = graph.make_key(Foo, predicate=SKIP_SELF)
+        assert key.graph is graph
+        assert graph[key].concrete == val
+        assert graph[graph.make_key(Foo, predicate=ONLY_SELF)].concrete == "c"
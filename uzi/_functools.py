@@ -135,6 +135,9 @@ class BoundParams:
     vals: FrozenDict[str, t.Any] = attr.ib(converter=FrozenDict)
     _pos_vals: int = attr.ib(converter=int)
     _pos_deps: int = attr.ib(converter=int)
+    _arg_deps: tuple["Node"] = attr.ib(converter=tuple)
+    _kwd_keys: tuple[str] = attr.ib(converter=tuple)
+    _kwd_deps: tuple["Node"] = attr.ib(converter=tuple)
 
     @property
     def dependencies(self) -> set["Node"]:
@@ -175,6 +178,9 @@ class BoundParams:
             vals=vals,
             pos_vals=pos_vals,
             pos_deps=pos_deps,
+            arg_deps=(p.dependency for p in args),
+            kwd_keys=(p.key for p in kwds),
+            kwd_deps=(p.dependency for p in kwds),
             aw_args=aw_args,
             aw_kwds=aw_kwds,
             is_async=not not (aw_args or aw_kwds),
@@ -39,7 +39,7 @@ def _calling_module(depth=2) -> t.Optional[str]:
     """Get the globals() or locals() scope of the calling scope"""
     name = sys._getframe(depth).f_globals.get("__name__")
     try:
-        name and import_module(name)
+        name and (name in sys.modules or import_module(name))
     except Exception:  # pragma: no cover
         return
     else:
@@ -163,7 +163,7 @@ class _ContainerRegistry(ReadonlyDict[str, dict["BaseContainer", None]]):
         return self.__contains(k)
 
     def __getitem__(self, k: str) -> tuple["BaseContainer"]:
-        return tuple(self.__getitem(k))
+        return tuple(self.__get(k, ()))
 
     def __missing__(self, key: str):
         return _dict_setdefault(self, key, WeakKeyDictionary())
@@ -569,6 +569,7 @@ class Group(BaseContainer):
 
     __slots__ = (
         "_g",
+        "_providers",
         "bases",
         "name",
         "module",
@@ -625,7 +626,11 @@ class Group(BaseContainer):
 
     @property
     def providers(self):
-        return ChainMap(*(a.providers for a in self.bases))
+        try:
+            return self._providers
+        except AttributeError:
+            self.__setattr(_providers=ChainMap(*(a.providers for a in self.bases)))
+            return self._providers
 
     @classmethod
     def _collect(cls, *a, **kw):
@@ -2,6 +2,7 @@ import typing as t
 from collections import abc
 from contextvars import ContextVar
 from logging import getLogger
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self
 
@@ -44,6 +45,7 @@ class DepKey:
         "abstract",
         "src",
         "_ash",
+        "__weakref__",
     )
 
     abstract: Injectable
@@ -51,6 +53,8 @@ class DepKey:
 
     graph: "Graph" = None
 
+    _interned: t.ClassVar[abc.MutableMapping[tuple, Self]] = WeakValueDictionary()
+
     def __init_subclass__(cls, scope=None) -> None:
         cls.graph = scope
         return super().__init_subclass__()
@@ -61,11 +65,14 @@ class DepKey:
         container: "Container" = None,
         predicate: ProPredicate = ProNoopPredicate(),
     ) -> Self:
-        self, src = _object_new(cls), DepSrc(
-            cls.graph, container, predicate or _noop_pred
-        )
-        self.__setattr(abstract=abstract, src=src, _ash=hash((abstract, src)))
-        return self
+        predicate = predicate or _noop_pred
+        ident = abstract.__class__, abstract, container, predicate
+        try:
+            return cls._interned[ident]
+        except KeyError:
+            self, src = _object_new(cls), DepSrc(cls.graph, container, predicate)
+            self.__setattr(abstract=abstract, src=src, _ash=hash((abstract, src)))
+            return cls._interned.setdefault(ident, self)
 
     @property
     def container(self):
@@ -107,10 +114,12 @@ class ProPaths(ReadonlyDict[DepSrc, _T_Pro]):
     __slots__ = (
         "graph",
         "pro",
+        "_pro_entries",
     )
 
     graph: "Graph"
     pro: FrozenDict["Container", int]
+    _pro_entries: tuple["Container"]
 
     __contains = dict.__contains__
     __setdefault = dict.setdefault
@@ -120,15 +129,16 @@ class ProPaths(ReadonlyDict[DepSrc, _T_Pro]):
         pro = {c: i for i, c in enumerate(graph.container.pro) if not c in base}
         if not pro:
             raise ProError(f"{graph.name}")
-        self.__setattr(graph=graph, pro=FrozenDict(pro))
+        self.__setattr(graph=graph, pro=FrozenDict(pro), _pro_entries=tuple(pro))
 
     def __contains__(self, x) -> bool:
         return x in self.pro or self.__contains(x)
 
     def __missing__(self, src: DepSrc):
-        pro, graph = tuple(self.pro), self.graph
+        pro, graph = self._pro_entries, self.graph
         src.graph.extends(graph)
-        pro = src.predicate.pro_entries(pro, graph, src)
+        if not (predicate := src.predicate) is _noop_pred:
+            pro = predicate.pro_entries(pro, graph, src)
         return self.__setdefault(src, tuple(pro))
 
 
@@ -163,7 +173,7 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
         self.__setattr(
             container=container,
             parent=_null_graph if parent is None else parent,
-            keyclass=type(f"BindKey", (DepKey,), {"graph": self}),
+            keyclass=type(f"BindKey", (DepKey,), {"graph": self, "_interned": {}}),
         )
         self.__setattr(
             pros=ProPaths(self),
@@ -194,7 +204,15 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
         return True
 
     def __contains__(self, o) -> bool:
-        return self.__contains(o) or o in self.pros or o in self.parent
+        if self.__contains(o) or o in self.pros:
+            return True
+
+        graph = self.parent
+        while graph.__class__.__contains__ is Graph.__contains__:
+            if graph.__contains(o) or o in graph.pros:
+                return True
+            graph = graph.parent
+        return o in graph
 
     def extends(self, graph: Self):
         return graph is self or self.parent.extends(graph)
@@ -232,34 +250,29 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
                 bind = self.__setdefault(dep_, bind)
             if recursive or not bind or self is bind.graph:
                 return bind
-        elif is_injectable(dep.abstract):
-            abstract = dep.abstract
-
-            if prov := self.find_provider(dep):
+        elif is_injectable(abstract := dep.abstract):
+            setdefault, find_provider = self.__setdefault, self.find_provider
 
-                if prov.container and not prov.container is dep.container:
-                    return self.__setdefault(
-                        dep, self[self.make_key(abstract, prov.container)]
-                    )
+            if prov := find_provider(dep):
+                if (container := prov.container) and not container is dep.container:
+                    return setdefault(dep, self[self.make_key(abstract, container)])
 
                 with self.stack.push(prov, abstract):
                     if bind := prov._resolve(abstract, self):
-                        return self.__setdefault(dep, bind)
+                        return setdefault(dep, bind)
             elif origin := t.get_origin(abstract):
                 if is_dependency_marker(origin):
-                    if prov := self.find_provider(
-                        dep.replace(abstract=t.get_origin(abstract))
-                    ):
+                    if prov := find_provider(dep.replace(abstract=origin)):
                         with self.stack.push(prov, abstract):
                             if bind := prov._resolve(abstract, self):
-                                return self.__setdefault(dep, bind)
+                                return setdefault(dep, bind)
                 elif bind := self.resolve(
                     dep.replace(abstract=origin), recursive=False
                 ):
-                    return self.__setdefault(dep, bind)
+                    return setdefault(dep, bind)
 
-            if recursive and ((bind := self.parent[dep]) or dep in self.parent):
-                return self.__setdefault(dep, bind)
+            if recursive and ((bind := (parent := self.parent)[dep]) or dep in parent):
+                return setdefault(dep, bind)
         else:
             raise TypeError(
                 f"expected an `Injectable` not `{dep.abstract.__class__.__qualname__}`"
@@ -343,7 +356,7 @@ _null_graph = NullGraph()
 @private_setattr
 class ResolutionStack(abc.Sequence):
 
-    __slots__ = ("__var",)
+    __slots__ = ("__var", "__get")
 
     class StackItem(t.NamedTuple):
         container: "Container"
@@ -351,6 +364,7 @@ class ResolutionStack(abc.Sequence):
         provider: "Provider" = None
 
     __var: ContextVar[tuple[StackItem]]
+    __get: abc.Callable[[], tuple[StackItem]]
 
     def __init__(self, default: "Container"):
         stack = (self.StackItem(default),)
@@ -358,6 +372,7 @@ class ResolutionStack(abc.Sequence):
             f"{default.name}.{self.__class__.__name__}", default=stack
         )
         self.__var.set(stack)
+        self.__get = self.__var.get
 
     @property
     def top(self):
@@ -375,14 +390,14 @@ class ResolutionStack(abc.Sequence):
 
     def pop(self):
         var = self.__var
-        stack = var.get()
+        stack = self.__get()
         if len(stack) < 2:
             raise ValueError(f"too many calls to pop()")
         var.set(stack[1:])
         return stack[0]
 
     def index(self, val, start=0, stop=None):
-        stack = self.__var.get()[start:stop:]
+        stack = self.__get()[start:stop:]
 
         if isinstance(val, tuple):
             return stack.index(val)
@@ -393,26 +408,26 @@ class ResolutionStack(abc.Sequence):
         raise ValueError(val)
 
     def __reversed__(self):
-        yield from reversed(self.__var.get())
+        yield from reversed(self.__get())
 
     def __contains__(self, k):
-        stack = self.__var.get()
+        stack = self.__get()
         if isinstance(k, tuple):
             return k in stack
         else:
             return any(k in x for x in stack)
 
     def __getitem__(self, k):
-        return self.__var.get()[k]
+        return self.__get()[k]
 
     def __bool__(self):
         return True
 
     def __len__(self):
-        return len(self.__var.get())
+        return len(self.__get())
 
     def __iter__(self):
-        return iter(self.__var.get())
+        return iter(self.__get())
 
     def __enter__(self):
         return self
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import partial
 import logging
 from threading import Lock
 from typing_extensions import Self
@@ -30,6 +31,8 @@ if t.TYPE_CHECKING:  # pragma: no cover
 
 _object_new = object.__new__
 
+_empty_deps = frozenset()
+
 
 _T_Concrete = t.TypeVar("_T_Concrete")
 """Provided `concrete` `TypeVar`"""
@@ -53,7 +56,14 @@ class Node(ABC, t.Generic[_T_Concrete]):
     concrete: _T_Concrete = attr.ib(kw_only=True, default=Missing, repr=True)
 
     is_async: bool = False
-    dependencies = frozenset[Self]()
+    dependencies: frozenset[Self] = _empty_deps
+
+    container: "Container" = attr.ib(init=False, repr=False)
+
+    @container.default
+    def _init_container(self):
+        if pro := self.provider or self.graph:
+            return pro.container
 
     _v_ident: tuple = attr.ib(init=False, repr=False)
 
@@ -67,20 +77,19 @@ class Node(ABC, t.Generic[_T_Concrete]):
     def _init_ash(self):
         return hash(self._v_ident)
 
-    @property
-    def container(self):
-        if pro := self.provider or self.graph:
-            return pro.container
-
     def __eq__(self, o: Self) -> bool:
-        if o.__class__ is self.__class__:
+        if o is self:
+            return True
+        elif o.__class__ is self.__class__:
             return o._v_ident == self._v_ident
         elif isinstance(o, Node):
             return False
         return NotImplemented
 
     def __ne__(self, o: Self) -> bool:
-        if o.__class__ is self.__class__:
+        if o is self:
+            return False
+        elif o.__class__ is self.__class__:
             return o._v_ident != self._v_ident
         elif isinstance(o, Node):
             return True
@@ -105,7 +114,7 @@ class MissingNode:
     graph: "Graph"
     container = None
     is_async: bool = False
-    dependencies = frozenset[Self]()
+    dependencies: frozenset[Self] = _empty_deps
 
     def __new__(
         cls: type[Self],
@@ -171,22 +180,42 @@ class Factory(Node[T_Injected]):
 
     @property
     def dependencies(self):
-        return self.params.dependencies
+        if params := self.params:
+            return params.dependencies
+        return _empty_deps
 
     def bind(self: Self, injector: "Injector"):
-        if self.params:
+        if not (params := self.params):
+            return self.concrete
+        elif not (params._pos_deps or params.kwds):
+            return partial(self.concrete, *self.resolve_args(injector), **params.vals)
+
+        vals = params.vals
+        func = self.concrete
+
+        if not params.kwds:
+            args = self.resolve_args(injector)
+
+            def factory():
+                nonlocal func, args, vals
+                return func(*args, **vals)
+
+        elif not params.args:
+            kwargs = self.resolve_kwargs(injector)
+
+            def factory():
+                nonlocal func, kwargs, vals
+                return func(**kwargs, **vals)
+
+        else:
             args = self.resolve_args(injector)
             kwargs = self.resolve_kwargs(injector)
-            vals = self.params.vals
-            func = self.concrete
 
             def factory():
                 nonlocal func, args, kwargs, vals
                 return func(*args, **kwargs, **vals)
 
-            return factory
-        else:
-            return self.concrete
+        return factory
 
     def resolve_args(self, injector: "Injector"):
         params = self.params
@@ -197,13 +226,16 @@ class Factory(Node[T_Injected]):
                     for p in params.args
                 )
             elif params._pos_deps > 0:
-                return _PositionalDeps(injector[p.dependency] for p in params.args)
+                return _PositionalDeps(map(injector.__getitem__, params._arg_deps))
             else:
                 return tuple(p.value for p in params.args)
         return ()
 
     def resolve_kwargs(self, injector: "Injector"):
-        return _KeywordDeps((p.key, injector[p.dependency]) for p in self.params.kwds)
+        params = self.params
+        return _KeywordDeps(
+            zip(params._kwd_keys, map(injector.__getitem__, params._kwd_deps))
+        )
 
 
 _T_FactoryNode = t.TypeVar("_T_FactoryNode", bound=Factory, covariant=True)
@@ -263,31 +295,39 @@ class Singleton(Factory[T_Injected]):
     # aw_enter: bool = attr.ib(kw_only=True, default=False)
 
     def factory(self, injector: "Injector"):
-        if self.params:
-            args = self.resolve_args(injector)
-            kwargs = self.resolve_kwargs(injector)
-            vals = self.params.vals
-            func = self.concrete
-            return lambda: func(*args, **kwargs, **vals)
-        else:
+        if not (params := self.params):
             return self.concrete
+        elif not (params._pos_deps or params.kwds):
+            return partial(self.concrete, *self.resolve_args(injector), **params.vals)
+
+        args = self.resolve_args(injector)
+        kwargs = self.resolve_kwargs(injector)
+        vals = params.vals
+        func = self.concrete
+        return lambda: func(*args, **kwargs, **vals)
 
     def bind(self, injector: "Injector"):
         func = self.factory(injector)
         value = Missing
-        lock = Lock() if self.thread_safe else None
 
-        def factory():
-            nonlocal func, value
-            if not value is Missing:
-                return value
+        if not self.thread_safe:
 
-            lock and lock.acquire(blocking=True)
-            try:
+            def factory():
+                nonlocal func, value
                 if value is Missing:
                     value = func()
-            finally:
-                lock and lock.release()
+                return value
+
+            return factory
+
+        lock = Lock()
+
+        def factory():
+            nonlocal func, value, lock
+            if value is Missing:
+                with lock:
+                    if value is Missing:
+                        value = func()
             return value
 
         return factory
@@ -306,18 +346,12 @@ class AsyncSingleton(Singleton[T_Injected]):
 
     def factory(self, injector: "Injector"):
         if params := self.params:
-            args, kwargs = self.resolve_args(injector), self.resolve_kwargs(injector)
-            return FutureFactoryWrapper(
-                self.concrete,
-                params.vals,
-                args=args,
-                kwargs=kwargs,
-                aw_call=self.async_call,
-            )
+            deps = self.resolve_args(injector), self.resolve_kwargs(injector)
         else:
-            return FutureFactoryWrapper(
-                self.concrete, self.params.vals, aw_call=self.async_call
-            )
+            deps = ()
+        return FutureFactoryWrapper(
+            self.concrete, params.vals, *deps, aw_call=self.async_call
+        )
 
 
 @attr.s(slots=True, frozen=True, cmp=False)
@@ -327,19 +361,7 @@ class AwaitParamsSingleton(Singleton[T_Injected], AwaitParamsFactory[T_Injected]
     is_async: bool = True
     async_call: bool = False
 
-    def factory(self, injector: "Injector"):
-        (args, aw_args), (kwargs, aw_kwargs) = self.resolve_args(
-            injector
-        ), self.resolve_kwargs(injector)
-        return FutureFactoryWrapper(
-            self.concrete,
-            self.params.vals,
-            args=args,
-            kwargs=kwargs,
-            aw_args=aw_args,
-            aw_kwargs=aw_kwargs,
-            aw_call=self.async_call,
-        )
+    factory = AwaitParamsFactory.bind
 
 
 @attr.s(slots=True, frozen=True, cmp=False)
@@ -363,14 +385,22 @@ class Partial(Factory[T_Injected]):
     """Partial node"""
 
     def factory(self: Self, injector: "Injector"):
+        if not (params := self.params):
+            return self.concrete
+        elif not (params._pos_deps or params.kwds):
+            return partial(self.concrete, *self.resolve_args(injector), **params.vals)
+
         args = self.resolve_args(injector)
         kwargs = self.resolve_kwargs(injector)
-        vals = self.params.vals
+        vals = params.vals
         func = self.concrete
+        skip = kwargs.skip
 
         def make(*a, **kw):
-            nonlocal func, args, kwargs, vals
-            return func(*args, *a, **(vals | kw), **kwargs.skip(kw))
+            nonlocal func, args, kwargs, vals, skip
+            if kw:
+                return func(*args, *a, **(vals | kw), **skip(kw))
+            return func(*args, *a, **vals, **kwargs)
 
         return make
 
@@ -424,8 +454,7 @@ class Callable(Partial[T_Injected]):
     """Callable node"""
 
     def bind(self: Self, injector: "Injector"):
-        func = self.factory(injector)
-        return lambda: func
+        return lambda f=self.factory(injector): f
 
 
 _T_CallableNode = t.TypeVar("_T_CallableNode", bound=Callable, covariant=True)
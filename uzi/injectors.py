@@ -81,13 +81,22 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
         return not not self.graph
 
     def __contains__(self, x) -> bool:
-        return self.__contains(x) or x in self.parent
+        if self.__contains(x):
+            return True
+
+        inj = self.parent
+        while inj.__class__.__contains__ is Injector.__contains__:
+            if inj.__contains(x):
+                return True
+            inj = inj.parent
+        return x in inj
 
     def __missing__(self, dep: Node):
         try:
-            return self.__setdefault(
-                dep, (dep.graph is self.graph and dep.bind(self)) or self.parent[dep]
-            )
+            fn = dep.bind(self) if dep.graph is self.graph else None
+            if fn is None:
+                fn = self.parent[dep]
+            return self.__setdefault(dep, fn)
         except AttributeError as e:
             raise TypeError(
                 f"Injector key must be a `Dependency` not `{dep.__class__.__qualname__}`"
@@ -138,6 +147,12 @@ class NullInjector(Injector):
 
     parent: t.Final = None
     _scope: "NullGraph" = None
+    __inj = None
+
+    def __new__(cls, *a, **kw):
+        if (self := cls.__dict__.get("_NullInjector__inj")) is None:
+            self = cls.__inj = super().__new__(cls)
+        return self
 
     @property
     def scope(self):
@@ -1,10 +1,10 @@
-from functools import reduce, wraps
+from functools import reduce
 from inspect import Parameter, signature
 from logging import getLogger
 import operator
 from types import FunctionType, GenericAlias, MethodType
 import typing as t
-from abc import ABC, ABCMeta, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod, get_cache_token
 from collections import abc
 from enum import Enum
 
@@ -61,6 +61,8 @@ _BLACKLIST = frozenset(
     }
 )
 
+_BLACKLIST_IDS = frozenset(map(id, _BLACKLIST))
+
 
 def is_injectable(obj):
     """Returns `True` if the given type annotation is injectable.
@@ -70,8 +72,10 @@ def is_injectable(obj):
     Returns:
         (bool): `True` if `typ` can be injected or `False` if otherwise.
     """
-    return isinstance(obj, Injectable) and not (
-        obj in _BLACKLIST or isinstance(obj, NonInjectable)
+    return (
+        not id(obj) in _BLACKLIST_IDS
+        and isinstance(obj, Injectable)
+        and not isinstance(obj, NonInjectable)
     )
 
 
@@ -97,14 +101,22 @@ class Injectable(metaclass=ABCMeta):
 
     __slots__ = ()
 
+    @classmethod
+    def __subclasshook__(cls, sub):
+        if cls is Injectable and issubclass(sub, _injectable_types):
+            return True
+        return NotImplemented
 
-Injectable.register(type)
-Injectable.register(t.TypeVar)
-Injectable.register(FunctionType)
-Injectable.register(MethodType)
-Injectable.register(GenericAlias)
-Injectable.register(type(t.Generic[T_Injected]))
-Injectable.register(type(t.Union))
+
+_injectable_types = (
+    type,
+    t.TypeVar,
+    FunctionType,
+    MethodType,
+    GenericAlias,
+    type(t.Generic[T_Injected]),
+    type(t.Union),
+)
 
 
 class NonInjectable(metaclass=ABCMeta):
@@ -123,6 +135,10 @@ __static_makers = {
 }
 
 
+_marker_types: dict[type, bool] = {}
+_marker_types_token = get_cache_token()
+
+
 @t.overload
 def is_dependency_marker(obj: "DependencyMarker") -> True:
     ...  # pragma: no cover
@@ -141,8 +157,20 @@ def is_dependency_marker(obj: t.Any, ind=0) -> bool:
     Returns:
         bool:
     """
+    global _marker_types_token
+    if _marker_types_token != (token := get_cache_token()):
+        _marker_types.clear()
+        _marker_types_token = token
+
+    try:
+        hit = _marker_types[obj.__class__]
+    except KeyError:
+        hit = _marker_types[obj.__class__] = isinstance(
+            obj, (DependencyMarker, DependencyMarkerType)
+        )
+
     return (
-        isinstance(obj, (DependencyMarker, DependencyMarkerType))
+        hit
         or obj in __static_makers
         or (not not (orig := t.get_origin(obj)) and is_dependency_marker(orig))
     )
@@ -255,24 +283,28 @@ class _PredicateCompareMixin:
             return self.vars != o.vars
         return NotImplemented
 
-    def __forward_op(op):
-        @wraps(op)
-        def method(self: Self, *a):
-            ident = self.vars
-            if not a:
-                return op(ident)
-            elif isinstance(a := a[0], ProPredicate):
-                return op(ident, a.vars)
-            return NotImplemented
+    def __ge__(self, o) -> bool:
+        if isinstance(o, ProPredicate):
+            return self.vars >= o.vars
+        return NotImplemented
 
-        return method
+    def __gt__(self, o) -> bool:
+        if isinstance(o, ProPredicate):
+            return self.vars > o.vars
+        return NotImplemented
 
-    __ge__, __gt__ = __forward_op(operator.ge), __forward_op(operator.gt)
-    __le__, __lt__ = __forward_op(operator.le), __forward_op(operator.lt)
+    def __le__(self, o) -> bool:
+        if isinstance(o, ProPredicate):
+            return self.vars <= o.vars
+        return NotImplemented
 
-    __hash__ = __forward_op(hash)
+    def __lt__(self, o) -> bool:
+        if isinstance(o, ProPredicate):
+            return self.vars < o.vars
+        return NotImplemented
 
-    del __forward_op
+    def __hash__(self) -> int:
+        return hash(self.vars)
 
 
 class ProPredicate(_PredicateBase, _PredicateOpsMixin, _PredicateCompareMixin, ABC):
@@ -322,7 +354,8 @@ class AccessModifier(ProEnumPredicate, Enum):
     def pro_entries(
         self, it: abc.Iterable["Container"], scope: "Graph", src: "DepSrc"
     ) -> abc.Iterable["Container"]:
-        return tuple(c for c in it if self in c.access_modifier(src.container))
+        accessor, vars = src.container, self.vars
+        return tuple(c for c in it if c.access_modifier(accessor).vars >= vars)
 
     def __contains__(self, obj) -> bool:
         return isinstance(obj, AccessModifier) and self.vars >= obj.vars
@@ -414,8 +447,11 @@ class ProOperatorPredicate(ProPredicate):
         self, it: abc.Iterable["Container"], *args
     ) -> abc.Iterable["Container"]:
         it = tuple(it)
-        res = self._reduce({*pred.pro_entries(it, *args)} for pred in self.vars)
-        return tuple(sorted(res, key=it.index))
+        res = self._reduce(
+            {*(it if pred is _noop_pred else pred.pro_entries(it, *args))}
+            for pred in self.vars
+        )
+        return tuple(c for c in it if c in res)
 
 
 class ProOrPredicate(ProOperatorPredicate):
@@ -446,6 +482,13 @@ class ProInvertPredicate(ProSubPredicate):
     def __new__(cls: type[Self], *right: _T_Pred) -> Self:
         return super().__new__(cls, _noop_pred, *right)
 
+    def pro_entries(
+        self, it: abc.Iterable["Container"], *args
+    ) -> abc.Iterable["Container"]:
+        it = tuple(it)
+        res = {c for pred in self.vars[1:] for c in pred.pro_entries(it, *args)}
+        return tuple(c for c in it if not c in res)
+
     def __copy__(self):
         return self.__class__(*self.vars[1:])
 
@@ -533,6 +576,8 @@ class ProFilter(ProPredicate):
 
 _noop_pred = ProNoopPredicate()
 
+_replace_keys = frozenset(("abstract", "predicate", "default"))
+
 
 @private_setattr
 class PureDep(DependencyMarker, t.Generic[T_Injectable]):
@@ -545,7 +590,7 @@ class PureDep(DependencyMarker, t.Generic[T_Injectable]):
         abstract (T_Injectable): the dependency to mark.
     """
 
-    __slots__ = ("_ident",)
+    __slots__ = ("_ident", "_ash", "_lookup")
 
     _ident: T_Injected
 
@@ -559,7 +604,7 @@ class PureDep(DependencyMarker, t.Generic[T_Injectable]):
         if abstract.__class__ is cls:
             return abstract
         self = _object_new(cls)
-        self.__setattr(_ident=abstract)
+        self.__setattr(_ident=abstract, _ash=hash(abstract))
         return self
 
     @property
@@ -568,7 +613,11 @@ class PureDep(DependencyMarker, t.Generic[T_Injectable]):
 
     @property
     def lookup(self):
-        return Lookup(self)
+        try:
+            return self._lookup
+        except AttributeError:
+            self.__setattr(_lookup=Lookup(self))
+            return self._lookup
 
     @property
     def __origin__(self):
@@ -595,7 +644,20 @@ class PureDep(DependencyMarker, t.Generic[T_Injectable]):
         }
 
     def replace(self, **kwds):
-        return Dep(*(self._as_dict() | kwds).values())
+        if kwds.keys() - _replace_keys:
+            raise TypeError(
+                f"{self.__class__.__qualname__}.replace() got unexpected "
+                f"keyword arguments {sorted(kwds.keys() - _replace_keys)}"
+            )
+        get = kwds.get
+        return Dep(
+            get("abstract", self.abstract),
+            get("predicate", self.predicate),
+            get("default", self.default),
+        )
+
+    def _with_predicate(self, predicate: ProPredicate):
+        return Dep(self.abstract, predicate, self.default)
 
     def __eq__(self, x) -> bool:
         cls = self.__class__
@@ -614,37 +676,30 @@ class PureDep(DependencyMarker, t.Generic[T_Injectable]):
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._ident)
+        return self._ash
 
     def __and__(self, x) -> Self:
         if isinstance(x, ProPredicate):
-            return self.replace(predicate=self.predicate & x)
+            return self._with_predicate(self.predicate & x)
         return NotImplemented
 
     def __rand__(self, x) -> Self:
         if isinstance(x, ProPredicate):
-            return self.replace(predicate=x & self.predicate)
+            return self._with_predicate(x & self.predicate)
         return NotImplemented
 
     def __or__(self, x) -> Self:
         if isinstance(x, ProPredicate):
-            return self.replace(predicate=self.predicate | x)
+            return self._with_predicate(self.predicate | x)
         return NotImplemented
 
     def __ror__(self, x) -> Self:
         if isinstance(x, ProPredicate):
-            return self.replace(predicate=x | self.predicate)
+            return self._with_predicate(x | self.predicate)
         return NotImplemented
 
     def __invert__(self) -> Self:
-        return self.replace(predicate=ProInvertPredicate(self.predicate))
-
-
-_pure_dep_default_set = frozenset(
-    [
-        (PureDep.predicate, PureDep.default),
-    ]
-)
+        return self._with_predicate(ProInvertPredicate(self.predicate))
 
 
 @private_setattr
@@ -652,7 +707,7 @@ class Dep(PureDep):
 
     """Marks an injectable as a `dependency` to be injected."""
 
-    __slots__ = "_ash"
+    __slots__ = ()
 
     def __new__(
         cls: type[Self],
@@ -661,14 +716,14 @@ class Dep(PureDep):
         default=Missing,
     ):
 
-        ident = abstract, predicate or _noop_pred, default
-        if ident[1:] in _pure_dep_default_set:
+        predicate = predicate or _noop_pred
+        if predicate is _noop_pred and default is Missing:
             if abstract.__class__ in (cls, PureDep):
                 return abstract
             return PureDep(abstract)
 
-        self = _object_new(cls)
-        self.__setattr(_ident=ident)
+        self, ident = _object_new(cls), (abstract, predicate, default)
+        self.__setattr(_ident=ident, _ash=hash(ident))
         return self
 
     @property
@@ -698,13 +753,6 @@ class Dep(PureDep):
     def __reduce__(self):
         return self.__class__, self._ident
 
-    def __hash__(self):
-        try:
-            return self._ash
-        except AttributeError:
-            self.__setattr(_ash=hash(self._ident))
-            return self._ash
-
     def __repr__(self) -> str:
         abstract, predicate, default = self.abstract, self.predicate, self.default
         return (
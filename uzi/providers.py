@@ -50,6 +50,18 @@ _T = t.TypeVar("_T")
 _T_Fn = t.TypeVar("_T_Fn", bound=abc.Callable, covariant=True)
 
 
+def _is_forward_ref(tp) -> bool:
+    return isinstance(tp, (str, t.ForwardRef)) or any(
+        map(_is_forward_ref, t.get_args(tp))
+    )
+
+
+def _has_forward_refs(sig: Signature) -> bool:
+    return _is_forward_ref(sig.return_annotation) or any(
+        _is_forward_ref(p.annotation) for p in sig.parameters.values()
+    )
+
+
 def _fluent_decorator(fn=None, default=Missing, *, fluent: bool = False):
     def decorator(func: _T_Fn) -> _T_Fn:
         @wraps(func)
@@ -216,7 +228,7 @@ class Provider(t.Generic[_T_Concrete, _T_Node]):
         Returns:
             bool: `True` if filters passed or `False` if otherwise
         """
-        self._freeze()
+        self._frozen or self._freeze()
         for fl in self.filters:
             if not fl(self, dep, scope):
                 return False
@@ -433,6 +445,7 @@ class Factory(
     # is_shared: t.ClassVar[bool] = False
 
     _signature: Signature = attr.ib(init=False, default=None)
+    _v_signature: Signature = attr.ib(init=False, default=None, cmp=False, repr=False)
 
     _blank_signature: t.ClassVar[Signature] = Signature()
     _arbitrary_signature: t.ClassVar[Signature] = Signature(
@@ -545,10 +558,14 @@ class Factory(
     def get_signature(self, dep: Injectable = None):
         sig = self._signature
         if sig is None:
+            if not None is (sig := self._v_signature):
+                return sig
             try:
-                return typed_signature(self.concrete)
+                sig = typed_signature(self.concrete)
             except ValueError:
-                return self._fallback_signature()
+                sig = self._fallback_signature()
+            if self._frozen and not _has_forward_refs(sig):
+                self.__setattr("_v_signature", sig, True)
         return sig
 
     def _fallback_signature(self):
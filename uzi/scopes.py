@@ -2,6 +2,7 @@ from contextvars import ContextVar
 from logging import getLogger
 from threading import Lock, local
 import typing as t
+from collections.abc import Callable
 
 from typing_extensions import Self
 
@@ -104,7 +105,7 @@ class Scope(t.Generic[_T_Injector]):
         return {}
 
     def injector(self, *, push=True) -> _T_Injector:
-        if inj := self.current:
+        if not (inj := self.current) is _null_injector:
             return inj
         elif push:
             return self.push()
@@ -235,18 +236,23 @@ _null_context_var = _NullContextVar()
 class ContextLocalScope(Scope[_T_Injector]):
     """A scope that uses `contextvars.ContextVar` to manage injectors"""
 
-    __slots__ = ("__var",)
+    __slots__ = (
+        "__var",
+        "__get",
+    )
 
     __var: ContextVar[_T_Injector]
+    __get: Callable[[], _T_Injector]
 
     def __init_attrs__(self, kwds):
-        self.__var = _null_context_var
+        self.__var, self.__get = _null_context_var, _null_context_var.get
         super().__init_attrs__(kwds)
         self.__var = ContextVar(f"{self.name}.injector", default=self.initial)
+        self.__get = self.__var.get
 
     @property
     def current(self):
-        return self.__var.get()
+        return self.__get()
 
     def _set_current(self, injector: _T_Injector) -> _T_Injector:
         self.__var.set(injector)
@@ -265,6 +271,12 @@ class NullScope(Scope[NullInjector]):
     level = -1
     graph = _null_graph
     name = "<null>"
+    __scope = None
+
+    def __new__(cls):
+        if (self := cls.__dict__.get("_NullScope__scope")) is None:
+            self = cls.__scope = super().__new__(cls)
+        return self
 
     def __init__(self) -> None:
         ...  # pragma: no cover